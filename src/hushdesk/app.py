@@ -196,6 +196,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 
 def _launch_gui() -> int:
+    from PySide6.QtGui import QPixmapCache
     from PySide6.QtWidgets import QApplication
 
     from hushdesk.ui.main_window import MainWindow
@@ -207,6 +208,8 @@ def _launch_gui() -> int:
     app = QApplication.instance() or QApplication(sys.argv)
     app.setApplicationName("HushDesk")
     app.setOrganizationName("HushDesk")
+    # Preview pages are several MB each; Qt's 10 MB default would hold only a couple.
+    QPixmapCache.setCacheLimit(256 * 1024)
 
     app_support_dir = _ensure_application_support_dir()
     _ = get_logger()
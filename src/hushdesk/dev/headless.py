@@ -17,7 +17,7 @@ try:  # pragma: no cover - optional dependency during tests
 except ImportError:  # pragma: no cover
     fitz = None  # type: ignore
 
-from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QCoreApplication, Qt
 
 from hushdesk.pdf.columns import select_audit_columns
 from hushdesk.pdf.dates import format_mmddyyyy, resolve_audit_date
@@ -51,13 +51,16 @@ class RunCapture:
     _BANDS_RE = re.compile(r"Processing (\d+) band pages")
 
     def attach(self, worker: AuditWorker) -> None:
-        worker.log.connect(self._on_log)
-        worker.warning.connect(self._on_warning)
-        worker.summary_counts.connect(self._on_summary)
-        worker.saved.connect(self._on_saved)
-        worker.finished.connect(self._on_finished)
-        worker.no_data_for_date.connect(self._on_no_data)
-        worker.audit_date_text.connect(self._on_audit_label)
+        # The worker runs synchronously on this thread, so every emit can call
+        # straight into the handler without Qt resolving the thread per emit.
+        direct = Qt.ConnectionType.DirectConnection
+        worker.log.connect(self._on_log, direct)
+        worker.warning.connect(self._on_warning, direct)
+        worker.summary_counts.connect(self._on_summary, direct)
+        worker.saved.connect(self._on_saved, direct)
+        worker.finished.connect(self._on_finished, direct)
+        worker.no_data_for_date.connect(self._on_no_data, direct)
+        worker.audit_date_text.connect(self._on_audit_label, direct)
 
     # --- Signal handlers -------------------------------------------------
 
@@ -91,9 +91,10 @@ def sanitize_filename(base: str) -> str:
 
 def safe_write_text(path: Path, text: str) -> Path:
     """Persist ``text`` to ``path``, falling back to Exports on TCC denials."""
+    payload = text.encode("utf-8")
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(text, encoding="utf-8")
+        path.write_bytes(payload)
         return path
     except OSError as exc:
         if exc.errno not in (errno.EPERM, errno.EACCES):
@@ -106,7 +107,7 @@ def safe_write_text(path: Path, text: str) -> Path:
             path,
             fallback_path,
         )
-        fallback_path.write_text(text, encoding="utf-8")
+        fallback_path.write_bytes(payload)
         return fallback_path
 
 
@@ -21,7 +21,8 @@ class DueMark(Enum):
     NONE = auto()
 
 
-ALLOWED_CODES = {4, 6, 11, 12, 15}
+ALLOWED_CODES = frozenset({4, 6, 11, 12, 15})
+CODE_TOKEN_RE = re.compile(r"\b(\d{1,2})\b")
 _TIME_RE = re.compile(r"\b(?:[0-1]?\d|2[0-3]):[0-5]\d\b")
 _CHECKMARK_RE = re.compile(r"[\u221A\u2713\u2714]")
 
@@ -96,9 +97,9 @@ def _extract_allowed_code(spans: Iterable[Tuple[str, Tuple[float, float, float,
         text = raw_text.strip()
         if ":" in text or "/" in text:
             continue
-        for token in re.findall(r"\b(\d{1,2})\b", text):
+        for match in CODE_TOKEN_RE.finditer(text):
             try:
-                value = int(token)
+                value = int(match.group(1))
             except ValueError:
                 continue
             if value in ALLOWED_CODES:
@@ -25,7 +25,7 @@ from .vitals_bounds import GateStats, gate_hr, gate_sbp
 Rect = Tuple[float, float, float, float]
 
 _HEADER_TOP_RATIO = 0.75
-ALLOWED_CODES = {4, 6, 11, 12, 15}
+ALLOWED_CODES = frozenset({4, 6, 11, 12, 15})
 _LABEL_NEIGHBOR_MAX_DY = 4.0  # PHASE6_LABEL_SLACK
 _LABEL_NEIGHBOR_MAX_DX = 140.0  # PHASE6_LABEL_SLACK
 _SUMMARY_NOISE_BANNERS = (
@@ -18,7 +18,7 @@ from hushdesk.pdf.mupdf_canon import CanonPage, iter_canon_pages
 from hushdesk.pdf.qa_overlay import QAHighlights, draw_overlay
 from hushdesk.report.model import DecisionRecord
 
-ALLOWED_CODES = {4, 6, 11, 12, 15}
+ALLOWED_CODES = frozenset({4, 6, 11, 12, 15})
 
 
 @dataclass(slots=True)
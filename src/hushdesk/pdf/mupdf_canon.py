@@ -70,7 +70,12 @@ def canonical_matrix(page: "fitz.Page", scale: float = 2.0) -> "fitz.Matrix":
     if fitz is None:  # pragma: no cover - handled by callers
         raise RuntimeError("PyMuPDF (fitz) is required for canonical matrices")
 
-    rotation_scale = fitz.Matrix(scale, scale).prerotate(-page.rotation)
+    rotation = page.rotation
+    if not rotation:
+        # Unrotated pages only need the scale plus an origin shift.
+        rect = page.rect
+        return fitz.Matrix(scale, 0.0, 0.0, scale, 0.0 - rect.x0 * scale, 0.0 - rect.y0 * scale)
+    rotation_scale = fitz.Matrix(scale, scale).prerotate(-rotation)
     rotated_rect = fitz.Rect(page.rect) * rotation_scale
     rotation_scale.e -= rotated_rect.x0
     rotation_scale.f -= rotated_rect.y0
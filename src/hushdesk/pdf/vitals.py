@@ -16,18 +16,24 @@ from hushdesk.accel import stitch_bp, y_cluster
 from .geometry import normalize_rect
 
 BP_RE = re.compile(r"(?i)\b(?:bp\s*)?(\d{2,3})\s*/\s*(\d{2,3})\b")
+BP_COLLAPSED_RE = re.compile(r"(\d[\d ]*?) ?/ ?(\d[\d ]*?)(?: ?/.*)?")
 BP_PREFIX_RE = re.compile(r"(?<!\d)(\d{2,3})\s*/\s*$")
 DIGITS_ONLY_RE = re.compile(r"^\d{2,3}$")
 DATE_LIKE_RE = re.compile(r"^\d{1,2}/\d{1,2}$")
-HR_RE = re.compile(r"(?i)\b(?:hr|pulse|heart\s*rate)\b[:\s]*(\d{2,3})\b")
-HR_LABEL_RE = re.compile(r"(?i)\b(?:hr|pulse|heart\s*rate)\b")
+# Alternations are ordered longest-first and use ``[ \t]`` rather than ``\s``;
+# every caller feeds ``_normalize_token`` output, so newlines never reach them.
+HR_RE = re.compile(r"(?i)\b(?:heart[ \t]*rate|pulse|hr)\b[: \t]*(\d{2,3})\b")
+HR_LABEL_RE = re.compile(r"(?i)\b(?:heart[ \t]*rate|pulse|hr)\b")
 PLAIN_HR_RE = re.compile(r"^\d{2,3}$")
 FALLBACK_BP_RE = re.compile(r"(?i)\b(?:bp[:\s]*)?(\d{2,3})\s*[/\-]\s*(\d{2,3})\b")
-FALLBACK_HR_RE = re.compile(r"(?i)\b(?:hr|pulse|p)\s*(\d{2,3})\b")
+FALLBACK_HR_RE = re.compile(r"(?i)\b(?:pulse|hr|p)[ \t]*(\d{2,3})\b")
 
 _FALLBACK_BIN_SIZE = 12.0
 _FALLBACK_WINDOW = 5.0
 
+_DIGITS = frozenset("0123456789")
+_WS_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
 HEADER_FRACTION = 0.25
 HEADER_MAX_OFFSET = 24.0
 
@@ -48,7 +54,7 @@ VitalsResult = Dict[str, Optional[Union[str, int]]]
 def parse_bp_token(text: str) -> Optional[str]:
     """Return ``SBP/DBP`` if ``text`` contains a blood pressure reading."""
 
-    if not text:
+    if not text or _DIGITS.isdisjoint(text):
         return None
     normalized = _normalize_token(text)
     match = BP_RE.search(normalized)
@@ -56,18 +62,21 @@ def parse_bp_token(text: str) -> Optional[str]:
         systolic, diastolic = match.groups()
         return f"{int(systolic)}/{int(diastolic)}"
 
-    collapsed = normalized.replace(" ", "")
-    if "/" in collapsed:
-        parts = collapsed.split("/")
-        if len(parts) >= 2 and parts[0].isdigit() and parts[1].isdigit():
-            return f"{int(parts[0])}/{int(parts[1])}"
+    collapsed = BP_COLLAPSED_RE.fullmatch(normalized)
+    if collapsed:
+        systolic, diastolic = (group.replace(" ", "") for group in collapsed.groups())
+        return f"{int(systolic)}/{int(diastolic)}"
     return None
 
 
-def parse_hr_token(text: str) -> Optional[int]:
-    """Return an integer heart-rate value discovered in ``text``."""
+def parse_hr_token(text: str, *, allow_plain: bool = True) -> Optional[int]:
+    """Return an integer heart-rate value discovered in ``text``.
+
+    With ``allow_plain`` a bare 2-3 digit token is accepted when no label is
+    present; fragments that read as a BP (``120/80``) are never treated as HR.
+    """
 
-    if not text:
+    if not text or _DIGITS.isdisjoint(text):
         return None
 
     normalized = _normalize_token(text)
@@ -79,6 +88,9 @@ def parse_hr_token(text: str) -> Optional[int]:
             return None
         if 30 <= value <= 220:
             return value
+        return None
+    if allow_plain:
+        return _parse_plain_hr_fragment(normalized)
     return None
 
 
@@ -103,7 +115,7 @@ def extract_vitals_in_band(
     nx0, ny0, nx1, ny1 = normalize_rect((x0, y0, x1, y1))
     rect = fitz.Rect(nx0, ny0, nx1, ny1)
     try:
-        text = page.get_text("dict", clip=rect)
+        words = page.get_text("words", clip=rect)
     except RuntimeError:
         return {"bp": None, "hr": None}
 
@@ -113,30 +125,27 @@ def extract_vitals_in_band(
 
     fragments: List[str] = []
     span_list: List[SpanData] = []
-    line_index = 0
-    for block in text.get("blocks", []):
-        for line in block.get("lines", []):
-            span_texts: List[str] = []
-            for span in line.get("spans", []):
-                raw_text = span.get("text")
-                bbox = span.get("bbox")
-                if not raw_text or not bbox:
-                    continue
-                normalized_bbox = normalize_rect(tuple(map(float, bbox)))
-                span_texts.append(str(raw_text))
-                span_list.append(_make_span_data(str(raw_text), normalized_bbox, line_index))
-            if span_texts:
-                fragments.append("".join(span_texts))
+    line_index = -1
+    line_key: Optional[Tuple[int, int]] = None
+    line_words: List[str] = []
+    for wx0, wy0, wx1, wy1, raw_text, block_no, line_no, _word_no in words:
+        if not raw_text:
+            continue
+        key = (block_no, line_no)
+        if key != line_key:
+            if line_words:
+                fragments.append(" ".join(line_words))
+            line_words = []
+            line_key = key
             line_index += 1
+        normalized_bbox = normalize_rect((float(wx0), float(wy0), float(wx1), float(wy1)))
+        line_words.append(raw_text)
+        span_list.append(_make_span_data(raw_text, normalized_bbox, line_index))
+    if line_words:
+        fragments.append(" ".join(line_words))
 
-    combined = "\n".join(fragments)
     bp_value = _select_bp_value(span_list, clip_rect)
 
-    if bp_value is None and combined:
-        fallback_bp = parse_bp_token(combined)
-        if fallback_bp and _is_plausible_bp_value(fallback_bp):
-            bp_value = fallback_bp
-
     if bp_value is None:
         for fragment in fragments:
             candidate = parse_bp_token(fragment)
@@ -147,7 +156,20 @@ def extract_vitals_in_band(
     hr_value = _select_hr_value(span_list, allow_plain_hr)
 
     if hr_value is None:
-        hr_value = parse_hr_token(combined)
+        for fragment in fragments:
+            hr_value = parse_hr_token(fragment, allow_plain=False)
+            if hr_value is not None:
+                break
+
+    # Only join lines when a reading may be split across them (e.g. "120/" + "80").
+    if (bp_value is None or hr_value is None) and len(fragments) > 1:
+        combined = " ".join(fragments)
+        if bp_value is None:
+            fallback_bp = parse_bp_token(combined)
+            if fallback_bp and _is_plausible_bp_value(fallback_bp):
+                bp_value = fallback_bp
+        if hr_value is None:
+            hr_value = parse_hr_token(combined, allow_plain=False)
 
     if hr_value is None and allow_plain_hr:
         for fragment in fragments:
@@ -918,6 +940,10 @@ def _span_overlaps_header(
 
 
 def _normalize_token(value: str) -> str:
-    replaced = value.replace("\n", " ").replace("\r", " ").strip()
+    # isprintable() is False for every separator str.split() honours except " ",
+    # so single-spaced, unpadded text is already in normalized form.
+    if value.isprintable() and "  " not in value and value[:1] != " " and value[-1:] != " ":
+        return value
+    replaced = value.translate(_WS_TABLE).strip()
     compressed = " ".join(replaced.split())
     return compressed
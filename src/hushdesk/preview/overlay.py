@@ -11,23 +11,26 @@ except ImportError:  # pragma: no cover
     fitz = None  # type: ignore
 
 from PySide6.QtCore import QRectF
-from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPixmap
 
 
 RectTuple = Tuple[float, float, float, float]
 
+_LABEL_PEN = QPen(QColor("#1F2937"))
+
 
 def render_band_preview(
     pdf_path: str,
     page_index: int,
-    overlays: Dict[str, object],
+    overlays: Optional[Dict[str, object]],
     out_png_path: Path,
 ) -> Path:
     """Render the requested page with audit overlays and persist as PNG."""
     if fitz is None:
         raise RuntimeError("PyMuPDF (fitz) is required to render previews.")
 
-    overlays = dict(overlays or {})
+    if overlays is None:
+        overlays = {}
     page_pixels = overlays.get("page_pixels")
     scale = 1.0
     if isinstance(page_pixels, dict):
@@ -47,12 +50,13 @@ def render_band_preview(
             target_width = 1600.0
             scale = max(1.0, target_width / width_pt) if width_pt > 0 else 1.0
         matrix = fitz.Matrix(scale, scale)
-        pix = page.get_pixmap(matrix=matrix)
-        pix.save(str(out_png_path))
-
-    pixmap = QPixmap(str(out_png_path))
-    if pixmap.isNull():
-        return out_png_path
+        pix = page.get_pixmap(matrix=matrix, alpha=False)
+        samples = pix.samples
+        image = QImage(samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            pix.save(str(out_png_path))
+            return out_png_path
 
     painter = QPainter(pixmap)
     painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
@@ -82,18 +86,14 @@ def render_band_preview(
 
     mark_rects = overlays.get("mark_bboxes")
     if isinstance(mark_rects, Iterable):
+        mark_fill, mark_pen = _rect_style(QColor("#FF2E88"), fill_alpha=70, pen_width=2)
+        painter.setPen(mark_pen)
         for rect in mark_rects:
-            _draw_rect(
-                painter,
-                _rect_from_overlay(rect),
-                QColor("#FF2E88"),
-                fill_alpha=70,
-                pen_width=2,
-            )
+            _draw_rect_fast(painter, _rect_from_overlay(rect), mark_fill)
 
     labels = overlays.get("labels")
     if isinstance(labels, Iterable):
-        painter.setPen(QPen(QColor("#1F2937")))
+        painter.setPen(_LABEL_PEN)
         for label in labels:
             if not isinstance(label, dict):
                 continue
@@ -144,13 +144,25 @@ def _draw_rect(
 ) -> None:
     if rect is None:
         return
-    x, y, width, height = rect
-    if width <= 0.0 or height <= 0.0:
-        return
+    fill_color, pen = _rect_style(color, fill_alpha=fill_alpha, pen_width=pen_width)
+    painter.setPen(pen)
+    _draw_rect_fast(painter, rect, fill_color)
+
+
+def _rect_style(color: QColor, *, fill_alpha: int, pen_width: int) -> Tuple[QColor, QPen]:
     fill_color = QColor(color)
     fill_color.setAlpha(max(0, min(255, fill_alpha)))
-    painter.fillRect(QRectF(x, y, width, height), fill_color)
     pen = QPen(color)
     pen.setWidth(max(1, pen_width))
-    painter.setPen(pen)
-    painter.drawRect(QRectF(x, y, width, height))
+    return fill_color, pen
+
+
+def _draw_rect_fast(painter: QPainter, rect: Optional[RectTuple], fill_color: QColor) -> None:
+    if rect is None:
+        return
+    x, y, width, height = rect
+    if width <= 0.0 or height <= 0.0:
+        return
+    q_rect = QRectF(x, y, width, height)
+    painter.fillRect(q_rect, fill_color)
+    painter.drawRect(q_rect)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Iterable, List, Optional
 from zoneinfo import ZoneInfo
@@ -12,6 +14,9 @@ from .model import DecisionRecord
 
 _CENTRAL = ZoneInfo("America/Chicago")
 _KIND_ORDER = ["HOLD-MISS", "HELD-OK", "COMPLIANT", "DC'D"]
+_KIND_INDEX = {kind: index for index, kind in enumerate(_KIND_ORDER)}
+_UNKNOWN_KIND_INDEX = len(_KIND_ORDER)
+_EXCEPTION_KINDS = frozenset({"HOLD-MISS", "HELD-OK"})
 _DOSE_ORDER = {"AM": 0, "PM": 1}
 
 
@@ -23,11 +28,24 @@ def write_report(
     source_basename: str,
     out_path: Path,
     notes: Optional[Iterable[str]] = None,
+    *,
+    generated_at: Optional[str] = None,
 ) -> None:
-    """Write the binder-ready TXT report to ``out_path``."""
+    """Write the binder-ready TXT report to ``out_path``.
+
+    ``generated_at`` lets callers writing many reports pass one precomputed
+    ``MM/DD/YYYY HH:MM`` Central timestamp instead of formatting it per call.
+    """
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    split_used = any("split" in _normalize_record_notes(record.notes) for record in records)
+    sorted_records = sorted(records, key=_record_sort_key)
+
+    split_used = any(
+        record.notes
+        and "split" in record.notes.lower()
+        and "split" in _normalize_record_notes(record.notes)
+        for record in records
+    )
 
     hall_upper = hall.upper()
     header = f"{audit_date_mmddyyyy} · Hall: {hall_upper} · Source: {source_basename}"
@@ -42,26 +60,18 @@ def write_report(
         dcd=counts.get("dcd", 0),
     )
 
-    lines: List[str] = [header, counts_line, ""]
-
-    exceptions = [record for record in records if record.kind in {"HOLD-MISS", "HELD-OK"}]
-    lines.append("Exceptions —")
-    if exceptions:
-        for record in _iter_sorted(exceptions):
-            lines.append(_format_record_line(record))
-    else:
-        lines.append("Hold-Miss: 0 (no exceptions)")
-
-    lines.append("")
-    lines.append("All Reviewed —")
-    sorted_records = list(_iter_sorted(records))
-    for kind in _KIND_ORDER:
-        for record in sorted_records:
-            if record.kind == kind:
-                lines.append(_format_record_line(record))
-
-    note_lines: List[str] = []
-    seen_notes: set[str] = set()
+    formatted = [(record.kind, _format_record_line(record)) for record in sorted_records]
+    exception_lines = [line for kind, line in formatted if kind in _EXCEPTION_KINDS]
+    if not exception_lines:
+        exception_lines = ["Hold-Miss: 0 (no exceptions)"]
+
+    reviewed_lines: dict[str, List[str]] = {kind: [] for kind in _KIND_ORDER}
+    for kind, line in formatted:
+        bucket = reviewed_lines.get(kind)
+        if bucket is not None:
+            bucket.append(line)
+
+    sanitized_notes: List[str] = []
     vitals_seen: set[tuple[str, str]] = set()
     split_noted = False
 
@@ -77,106 +87,91 @@ def write_report(
             if vitals_key in vitals_seen:
                 continue
             vitals_seen.add(vitals_key)
-        if sanitized in seen_notes:
-            continue
-        note_lines.append(sanitized)
-        seen_notes.add(sanitized)
+        sanitized_notes.append(sanitized)
 
+    unique_notes = dict.fromkeys(sanitized_notes)
     if split_used or split_noted:
-        aggregate = "AM/PM labels missing (split)"
-        if aggregate not in seen_notes:
-            note_lines.append(aggregate)
-            seen_notes.add(aggregate)
+        unique_notes.setdefault("AM/PM labels missing (split)")
+    note_lines = list(unique_notes)
 
+    note_section: List[str] = []
     if note_lines:
-        lines.append("")
-        for text in note_lines:
-            lines.append(f"Notes — {text}")
-
-    lines.append("")
-    generated_stamp = datetime.now(_CENTRAL).strftime("%m/%d/%Y %H:%M")
-    lines.append(f"Generated: {generated_stamp} (Central)")
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
-
-
-def _iter_sorted(records: Iterable[DecisionRecord]) -> Iterable[DecisionRecord]:
-    return sorted(records, key=_record_sort_key)
+        note_section.append("")
+        note_section.extend(f"Notes — {text}" for text in note_lines)
+
+    generated_stamp = generated_at or datetime.now(_CENTRAL).strftime("%m/%d/%Y %H:%M")
+    sections = chain(
+        (header, counts_line, "", "Exceptions —"),
+        exception_lines,
+        ("", "All Reviewed —"),
+        chain.from_iterable(reviewed_lines[kind] for kind in _KIND_ORDER),
+        note_section,
+        ("", f"Generated: {generated_stamp} (Central)"),
+    )
+    out_path.write_bytes("\n".join(sections).encode("utf-8"))
 
 
 def _record_sort_key(record: DecisionRecord) -> tuple:
     room = record.room_bed or "Unknown"
-    room_key = (room.lower() == "unknown", room)
+    room_key = (len(room) == 7 and room.casefold() == "unknown", room)
     dose_key = _DOSE_ORDER.get(record.dose, 0)
-    kind_key = _KIND_ORDER.index(record.kind) if record.kind in _KIND_ORDER else len(_KIND_ORDER)
+    kind_key = _KIND_INDEX.get(record.kind, _UNKNOWN_KIND_INDEX)
     return (room_key, dose_key, kind_key, record.rule_text)
 
 
 def _format_record_line(record: DecisionRecord) -> str:
-    dose_label = record.dose
-
     if record.kind == "DC'D":
         reason = record.dcd_reason or "X in due cell"
-        return f"{record.kind} — {record.room_bed} ({dose_label}) — {reason}"
+        return f"{record.kind} — {record.room_bed} ({record.dose}) — {reason}"
 
     rule_text = _strip_source_suffix(record.rule_text)
-    base = f"{record.kind} — {record.room_bed} ({dose_label}) — {rule_text}"
-    detail_parts: List[str] = []
+    base = f"{record.kind} — {record.room_bed} ({record.dose}) — {rule_text}"
     vital_text = record.vital_text.strip()
-    if vital_text:
-        detail_parts.append(vital_text)
-    if record.kind == "HELD-OK" and record.code is not None:
-        detail_parts.append(f"| code {record.code}")
-
-    if not detail_parts:
-        return base
-
-    if detail_parts[0].startswith("|"):
-        return f"{base} {detail_parts[0]}"
-
-    if len(detail_parts) == 1:
-        return f"{base}; {detail_parts[0]}"
-
-    formatted = "; ".join(part for part in detail_parts if not part.startswith("|"))
-    suffix = " ".join(part for part in detail_parts if part.startswith("|"))
+    code_text = f"| code {record.code}" if record.kind == "HELD-OK" and record.code is not None else ""
 
-    message = f"{base}; {formatted}"
-    if suffix:
-        message = f"{message} {suffix}"
-    return message
+    if not vital_text:
+        return f"{base} {code_text}" if code_text else base
+    if vital_text.startswith("|"):
+        return f"{base} {vital_text}"
+    if code_text:
+        return f"{base}; {vital_text} {code_text}"
+    return f"{base}; {vital_text}"
 
 
-def _normalize_record_notes(notes: Optional[str]) -> set[str]:
+@lru_cache(maxsize=1024)
+def _normalize_record_notes(notes: Optional[str]) -> frozenset[str]:
     if not notes:
-        return set()
+        return frozenset()
     tokens = []
     for piece in notes.split(";"):
         token = piece.strip().lower()
         if token:
             tokens.append(token)
-    return set(tokens)
+    return frozenset(tokens)
 
 
 def _sanitize_note_text(text: str) -> tuple[str, bool]:
     """Return note text without inline ``(split)`` markers and whether one was removed."""
 
-    lower_text = text.lower()
-    has_split = "(split" in lower_text
-    if not has_split:
+    if _SPLIT_MARKER_RE.search(text) is None:
         return text, False
 
-    cleaned = re.sub(r"\s*\(split\)", "", text, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned).strip()
+    cleaned = _SPLIT_PAREN_RE.sub("", text)
+    cleaned = _MULTI_WS_RE.sub(" ", cleaned).strip()
     cleaned = cleaned.replace("( ", "(").replace(" )", ")")
     return cleaned, True
 
 
+_SPLIT_MARKER_RE = re.compile(r"\(split", re.IGNORECASE)
+_SPLIT_PAREN_RE = re.compile(r"\s*\(split\)", re.IGNORECASE)
+_MULTI_WS_RE = re.compile(r"\s{2,}")
 _SOURCE_SUFFIX_RE = re.compile(r"\s*(?:[;|])?\s*Source:\s*.+$", re.IGNORECASE)
 _VITALS_NOTE_RE = re.compile(
     r"(?i)^vitals\s+missing\s*\(unexpected\)\s*—\s*(?P<room>[^()]+?)\s*\((?P<dose>[^)]+)\)"
 )
 
 
+@lru_cache(maxsize=1024)
 def _strip_source_suffix(text: Optional[str]) -> str:
     if not text:
         return ""
@@ -1,5 +1,17 @@
 """UI module namespace for HushDesk."""
 
-from .main_window import MainWindow
+from __future__ import annotations
+
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    if name == "MainWindow":
+        from .main_window import MainWindow
+
+        globals()["MainWindow"] = MainWindow
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["MainWindow"]
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import subprocess
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import QEvent, QObject, Qt, QUrl, QRectF
-from PySide6.QtGui import QColor, QDesktopServices, QPainter, QPen, QPixmap
+from PySide6.QtCore import QEvent, QObject, QRectF, QRunnable, Qt, QThreadPool, QTimer, QUrl, Signal
+from PySide6.QtGui import QColor, QBrush, QDesktopServices, QImage, QPainter, QPen, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -22,6 +23,89 @@ try:  # pragma: no cover - optional dependency
 except ImportError:  # pragma: no cover
     fitz = None  # type: ignore
 
+# Custom zoom percentages are relative to this raster scale.
+_BASE_RENDER_SCALE = 1.5
+_RENDER_SCALES = (1.0, 1.5, 2.0, 3.0)
+_FIT_MODES = frozenset({"width", "page"})
+# Generation used by neighbour prefetch jobs; never matches a live request.
+_PREFETCH_GENERATION = -1
+
+
+def _overlay_style(color: QColor, pen_width: int, fill_alpha: int) -> Tuple[QPen, QBrush]:
+    pen = QPen(color)
+    pen.setWidth(max(1, pen_width))
+    if fill_alpha <= 0:
+        return pen, QBrush(Qt.BrushStyle.NoBrush)
+    fill_color = QColor(color)
+    fill_color.setAlpha(min(255, fill_alpha))
+    return pen, QBrush(fill_color)
+
+
+_BAND_STYLE = _overlay_style(QColor(37, 99, 235), 2, 30)
+_SLOT_STYLE = _overlay_style(QColor(16, 185, 129), 3, 50)
+_DUE_STYLE = _overlay_style(QColor(249, 115, 22), 3, 0)
+_BP_STYLE = _overlay_style(QColor(139, 92, 246), 2, 60)
+_HR_STYLE = _overlay_style(QColor(14, 165, 233), 2, 60)
+
+# Constant handler; the PDF path and page number arrive as osascript arguments.
+_PREVIEW_SCRIPT = "\n".join(
+    [
+        "on run argv",
+        "set pdfPath to POSIX file (item 1 of argv)",
+        "set pageNumber to (item 2 of argv) as integer",
+        'tell application "Preview"',
+        "activate",
+        "open pdfPath",
+        # Poll (<= 0.6s) for the document instead of a fixed delay; matching the
+        # path avoids acting on another PDF already open in Preview.
+        "repeat 30 times",
+        "try",
+        "if path of front document is (POSIX path of pdfPath) then exit repeat",
+        "end try",
+        "delay 0.02",
+        "end repeat",
+        "try",
+        "set theDoc to front document",
+        "go to page pageNumber of theDoc",
+        "end try",
+        "end tell",
+        "end run",
+    ]
+)
+
+PageKey = Tuple[str, float, int, float]
+# (pen, brush) plus page-space (x, y, width, height) boxes validated once per record.
+OverlayGroup = Tuple[Tuple[QPen, QBrush], List[Tuple[float, float, float, float]]]
+
+
+class _PreviewJobSignals(QObject):
+    # generation, page key, rendered page image (or None)
+    finished = Signal(int, object, object)
+
+
+class _PreviewJob(QRunnable):
+    """Rasterize one PDF page off the GUI thread."""
+
+    def __init__(
+        self,
+        panel: "EvidencePanel",
+        generation: int,
+        page_key: PageKey,
+    ) -> None:
+        super().__init__()
+        self._panel = panel
+        self._signals = panel._preview_signals
+        self._generation = generation
+        self._page_key = page_key
+
+    def run(self) -> None:  # pragma: no cover - exercised via the Qt thread pool
+        image = self._panel._render_page_image(self._page_key, self._generation)
+        try:
+            self._signals.finished.emit(self._generation, self._page_key, image)
+        except RuntimeError:
+            # The panel was destroyed while the page was rendering.
+            pass
+
 
 class EvidencePanel(QWidget):
     """Right-side drawer with decision details and PDF previews."""
@@ -35,9 +119,21 @@ class EvidencePanel(QWidget):
         super().__init__(parent)
         self._allow_open_pdf = allow_open_pdf
         self._record: Optional[dict] = None
+        self._extras: dict = {}
+        self._overlay_groups: List[OverlayGroup] = []
+        self._page_index: Optional[int] = None
         self._pdf_path: Optional[Path] = None
-        self._preview_cache: Dict[Tuple[str, int], QPixmap] = {}
+        self._has_pdf = False
+        # PyMuPDF documents are not thread-safe; preview jobs render under this lock.
+        self._doc_lock = threading.Lock()
+        self._fitz_doc: Optional[Tuple[str, float, "fitz.Document"]] = None
+        self._preview_generation = 0
+        self._preview_signals = _PreviewJobSignals(self)
+        self._preview_signals.finished.connect(self._handle_page_rendered)
+        self._prefetch_pending: set[str] = set()
         self._current_preview_pixmap: Optional[QPixmap] = None
+        self._current_render_scale = _BASE_RENDER_SCALE
+        self._scaled_state: Optional[tuple] = None
         self._preview_scale_pct = 100
         self._fit_mode = "custom"
         self._build_ui()
@@ -94,19 +190,43 @@ class EvidencePanel(QWidget):
         self.preview_area.viewport().installEventFilter(self)
         layout.addWidget(self.preview_area, stretch=1)
 
+        # Coalesce bursts of viewport resizes (splitter drags) into one rescale.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._rescale_preview)
+
     def clear(self, message: Optional[str] = None) -> None:
         self._record = None
+        self._extras = {}
+        self._overlay_groups = []
+        self._page_index = None
         self._pdf_path = None
+        self._has_pdf = False
+        self._preview_generation += 1
+        self._prefetch_pending.clear()
+        self._close_document()
         self._current_preview_pixmap = None
+        self._current_render_scale = _BASE_RENDER_SCALE
         self.summary_label.setText(message or "Select a decision to view details.")
         self.details_label.clear()
         self.preview_label.clear()
+        self._scaled_state = None
         self.preview_status.setText("Preview not generated.")
         self.open_button.setEnabled(False)
         self.preview_button.setEnabled(False)
 
     def set_record(self, record: Optional[dict], pdf_path: Optional[Path]) -> None:
-        self._record = dict(record) if isinstance(record, dict) else None
+        # Read-only use; callers already hand over their own copy of the record.
+        self._record = record if isinstance(record, dict) else None
+        self._extras = self._as_dict(self._record.get("extras")) if self._record else {}
+        self._overlay_groups = self._collect_overlay_groups(self._extras)
+        self._page_index = self._extract_page_index(self._record) if self._record else None
+        self._preview_generation += 1
+        # The shown raster belongs to the previous record; zoom or resize must not
+        # repaint this record's overlays onto it.
+        self._current_preview_pixmap = None
+        self._current_render_scale = _BASE_RENDER_SCALE
         self._pdf_path = Path(pdf_path) if isinstance(pdf_path, Path) else (Path(pdf_path) if isinstance(pdf_path, str) else None)
         if not self._record:
             self.clear()
@@ -114,28 +234,30 @@ class EvidencePanel(QWidget):
 
         summary = self._format_summary(self._record)
         self.summary_label.setText(summary)
-        details = self._format_details(self._record)
+        details = self._format_details(self._record, self._extras)
         self.details_label.setText(details)
 
-        has_pdf = self._pdf_path is not None and self._pdf_path.exists()
-        page_index = self._extract_page_index(self._record)
+        # Stat the PDF once per selection; the handlers reuse the result.
+        self._has_pdf = self._pdf_path is not None and self._pdf_path.exists()
+        page_index = self._page_index
         if self._allow_open_pdf:
-            self.open_button.setEnabled(has_pdf and page_index is not None)
+            self.open_button.setEnabled(self._has_pdf and page_index is not None)
         else:
             self.open_button.setEnabled(False)
-        self.preview_button.setEnabled(has_pdf and fitz is not None and page_index is not None)
+        self.preview_button.setEnabled(self._has_pdf and fitz is not None and page_index is not None)
         self.preview_status.setText("Preview not generated." if fitz is not None else "Preview requires PyMuPDF.")
         self.preview_label.clear()
+        self._scaled_state = None
 
     def _handle_open_pdf(self) -> None:
         if not self._allow_open_pdf or not self._record or not self._pdf_path:
             return
-        page_index = self._extract_page_index(self._record)
+        page_index = self._page_index
         if page_index is None:
             return
         page_number = page_index + 1
         url = QUrl.fromLocalFile(str(self._pdf_path))
-        if not self._pdf_path.exists():
+        if not self._has_pdf:
             QDesktopServices.openUrl(url)
             return
         try:
@@ -148,18 +270,73 @@ class EvidencePanel(QWidget):
     def _handle_preview(self) -> None:
         if not self._record or not self._pdf_path or fitz is None:
             return
-        cache_key = (str(self._pdf_path), int(self._record.get("id", -1)))
-        pixmap = self._preview_cache.get(cache_key)
-        if pixmap is None:
-            pixmap = self._render_preview(self._record, self._pdf_path)
-            if pixmap is None:
-                self.preview_status.setText("Unable to render preview.")
-                return
-            self._preview_cache[cache_key] = pixmap
+        page_index = self._page_index
+        try:
+            mtime = self._pdf_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        if page_index is None or mtime is None:
+            self.preview_status.setText("Unable to render preview.")
+            return
+        render_scale = self._target_render_scale()
+        page_key = (str(self._pdf_path), mtime, page_index, render_scale)
+        self._preview_generation += 1
+        # Only clean pages are cached (in Qt's global pixmap cache); overlays are
+        # painted onto the display-sized copy in _apply_preview_scale.
+        base = QPixmapCache.find(self._page_cache_key(page_key))
+        if base is not None:
+            self._show_preview(base, page_key)
+            return
+        self.preview_status.setText("Loading preview...")
+        QThreadPool.globalInstance().start(_PreviewJob(self, self._preview_generation, page_key))
+
+    def _handle_page_rendered(
+        self,
+        generation: int,
+        page_key: PageKey,
+        image: Optional[QImage],
+    ) -> None:
+        cache_key = self._page_cache_key(page_key)
+        self._prefetch_pending.discard(cache_key)
+        base = QPixmap.fromImage(image) if image is not None else None
+        if base is not None and base.isNull():
+            base = None
+        if base is not None:
+            QPixmapCache.insert(cache_key, base)
+        if generation != self._preview_generation or not self._record:
+            return
+        if base is None:
+            self.preview_status.setText("Unable to render preview.")
+            return
+        self._show_preview(base, page_key)
+
+    @staticmethod
+    def _page_cache_key(page_key: PageKey) -> str:
+        pdf_path, mtime, page_index, render_scale = page_key
+        return f"hushdesk:evidence:{pdf_path}:{mtime}:{page_index}:{render_scale}"
+
+    def _show_preview(self, pixmap: QPixmap, page_key: PageKey) -> None:
         self._current_preview_pixmap = pixmap
+        self._current_render_scale = page_key[3]
         self._apply_preview_scale()
-        page_index = self._extract_page_index(self._record) or 0
+        page_index = self._page_index or 0
         self.preview_status.setText(f"Preview: page {page_index + 1}.")
+        self._prefetch_neighbors(page_key)
+
+    def _prefetch_neighbors(self, page_key: PageKey) -> None:
+        # Adjacent decisions usually sit on the same or a neighbouring page, so
+        # warm those rasters at low priority while this one is being read.
+        pdf_path, mtime, page_index, render_scale = page_key
+        pool = QThreadPool.globalInstance()
+        for neighbor in (page_index + 1, page_index - 1):
+            if neighbor < 0:
+                continue
+            neighbor_key = (pdf_path, mtime, neighbor, render_scale)
+            cache_key = self._page_cache_key(neighbor_key)
+            if cache_key in self._prefetch_pending or QPixmapCache.find(cache_key) is not None:
+                continue
+            self._prefetch_pending.add(cache_key)
+            pool.start(_PreviewJob(self, _PREFETCH_GENERATION, neighbor_key), -1)
 
     @staticmethod
     def _format_summary(record: dict) -> str:
@@ -171,8 +348,7 @@ class EvidencePanel(QWidget):
         return f"{line}\n{notes}" if notes else line
 
     @staticmethod
-    def _format_details(record: dict) -> str:
-        extras = record.get("extras", {}) if isinstance(record, dict) else {}
+    def _format_details(record: dict, extras: dict) -> str:
         rule = record.get("rule_text") or ""
         vital = record.get("vital_text") or ""
         mark = extras.get("mark_display") or record.get("mark_display") or "—"
@@ -197,16 +373,19 @@ class EvidencePanel(QWidget):
         return "\n".join(lines)
 
     def set_zoom_percent(self, pct: int) -> None:
+        pct = max(25, min(400, int(pct)))
+        if self._fit_mode == "custom" and self._preview_scale_pct == pct:
+            return
         self._fit_mode = "custom"
-        self._preview_scale_pct = max(25, min(400, int(pct)))
-        self._apply_preview_scale()
+        self._preview_scale_pct = pct
+        self._rescale_preview()
 
     def set_fit_mode(self, mode: str) -> None:
-        if mode not in {"width", "page"}:
-            self._fit_mode = "custom"
-        else:
-            self._fit_mode = mode
-        self._apply_preview_scale()
+        normalized = mode if mode in _FIT_MODES else "custom"
+        if normalized == self._fit_mode and normalized != "custom":
+            return
+        self._fit_mode = normalized
+        self._rescale_preview()
 
     def current_zoom_percent(self) -> int:
         return self._preview_scale_pct
@@ -214,20 +393,61 @@ class EvidencePanel(QWidget):
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
         if obj is self.preview_area.viewport() and event.type() == QEvent.Type.Resize:
             if self._current_preview_pixmap is not None:
-                self._apply_preview_scale()
+                self._resize_timer.start()
         return super().eventFilter(obj, event)
 
+    def _rescale_preview(self) -> None:
+        self._apply_preview_scale()
+        # Re-rasterize only when the view now needs more pixels than we have.
+        if self._current_preview_pixmap is not None and self._target_render_scale() > self._current_render_scale:
+            self._handle_preview()
+
+    def _target_render_scale(self) -> float:
+        extras = self._extras
+        page_width = float(extras.get("page_width") or 0.0)
+        page_height = float(extras.get("page_height") or 0.0)
+        viewport = self.preview_area.viewport()
+        if self._fit_mode == "width" and page_width > 0:
+            needed = viewport.width() / page_width
+        elif self._fit_mode == "page" and page_width > 0 and page_height > 0:
+            needed = min(viewport.width() / page_width, viewport.height() / page_height)
+        elif self._fit_mode == "custom":
+            needed = _BASE_RENDER_SCALE * self._preview_scale_pct / 100.0
+        else:
+            needed = _BASE_RENDER_SCALE
+        # Raster at physical pixels so Retina displays are not upscaled blurrily.
+        needed *= viewport.devicePixelRatioF()
+        for scale in _RENDER_SCALES:
+            if scale >= needed:
+                return scale
+        return _RENDER_SCALES[-1]
+
     def _apply_preview_scale(self) -> None:
         pixmap = self._current_preview_pixmap
         if pixmap is None:
             self.preview_label.clear()
+            self._scaled_state = None
             return
         viewport = self.preview_area.viewport()
+        dpr = viewport.devicePixelRatioF()
+        # Skip the smooth rescale when nothing that feeds it has changed.
+        state = (
+            pixmap.cacheKey(),
+            self._fit_mode,
+            viewport.width(),
+            viewport.height(),
+            dpr,
+            self._preview_scale_pct,
+            self._current_render_scale,
+        )
+        if state == self._scaled_state:
+            return
+        self._scaled_state = state
         if self._fit_mode == "width":
-            width = max(1, viewport.width())
+            width = max(1, round(viewport.width() * dpr))
             scaled = pixmap.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
         elif self._fit_mode == "page":
-            size = viewport.size()
+            size = viewport.size() * dpr
             if size.width() <= 0 or size.height() <= 0:
                 scaled = pixmap
             else:
@@ -238,6 +458,7 @@ class EvidencePanel(QWidget):
                 )
         else:
             scale = max(0.25, min(4.0, self._preview_scale_pct / 100.0))
+            scale *= _BASE_RENDER_SCALE / self._current_render_scale * dpr
             width = max(1, int(pixmap.width() * scale))
             height = max(1, int(pixmap.height() * scale))
             scaled = pixmap.scaled(
@@ -246,7 +467,14 @@ class EvidencePanel(QWidget):
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation,
             )
-        self.preview_label.setPixmap(scaled)
+        rendered = self._render_preview(self._extras, self._overlay_groups, scaled, pixmap)
+        # Overlays are painted in device pixels; only then tag the logical size.
+        rendered.setDevicePixelRatio(dpr)
+        self.preview_label.setPixmap(rendered)
+
+    @staticmethod
+    def _as_dict(value: object) -> dict:
+        return value if isinstance(value, dict) else {}
 
     @staticmethod
     def _describe_source(source_type: Optional[str], flags: Optional[dict]) -> str:
@@ -267,7 +495,7 @@ class EvidencePanel(QWidget):
     def _extract_page_index(record: dict) -> Optional[int]:
         extras = record.get("extras") if isinstance(record, dict) else None
         value = extras.get("page_index") if isinstance(extras, dict) else None
-        if isinstance(value, int):
+        if type(value) is int:
             return value
         try:
             return int(value)
@@ -276,93 +504,130 @@ class EvidencePanel(QWidget):
 
     @staticmethod
     def _launch_preview_script(pdf_path: Path, page_number: int) -> None:
-        escaped_pdf = str(pdf_path).replace('"', '\\"')
-        script_lines = [
-            f'set pdfPath to POSIX file "{escaped_pdf}"',
-            f'set pageNumber to {page_number}',
-            "tell application \"Preview\"",
-            "activate",
-            "open pdfPath",
-            "delay 0.3",
-            "try",
-            "set theDoc to front document",
-            "go to page pageNumber of theDoc",
-            "end try",
-            "end tell",
-        ]
-        args: List[str] = ["osascript"]
-        for line in script_lines:
-            args.extend(["-e", line])
-        subprocess.run(args, check=False)
-
-    def _render_preview(self, record: dict, pdf_path: Path) -> Optional[QPixmap]:
-        if fitz is None:
-            return None
-        page_index = self._extract_page_index(record)
-        if page_index is None:
-            return None
-        extras = record.get("extras", {}) if isinstance(record, dict) else {}
-        try:
-            with fitz.open(pdf_path) as doc:  # type: ignore[attr-defined]
-                if page_index < 0 or page_index >= len(doc):
-                    return None
-                page = doc.load_page(page_index)
-                pix = page.get_pixmap(matrix=fitz.Matrix(1.5, 1.5))
-        except Exception:  # pragma: no cover - defensive
-            return None
-
-        pixmap = QPixmap()
-        pixmap.loadFromData(pix.tobytes("png"))
-        if pixmap.isNull():
-            return None
-
-        page_width = float(extras.get("page_width") or pix.width)
-        page_height = float(extras.get("page_height") or pix.height)
+        subprocess.run(
+            ["osascript", "-", pdf_path.as_posix(), str(int(page_number))],
+            input=_PREVIEW_SCRIPT,
+            text=True,
+            check=False,
+        )
+
+    def _render_preview(
+        self,
+        extras: dict,
+        groups: List[OverlayGroup],
+        scaled: QPixmap,
+        source: QPixmap,
+    ) -> QPixmap:
+        # Paint on a copy so the cached page behind ``scaled`` is never touched.
+        pixmap = QPixmap(scaled)
+
+        page_width = float(extras.get("page_width") or source.width())
+        page_height = float(extras.get("page_height") or source.height())
         scale_x = pixmap.width() / page_width if page_width else 1.0
         scale_y = pixmap.height() / page_height if page_height else 1.0
 
+        # Overlays are axis-aligned boxes, so antialiasing would only add edge cost.
         painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
-        band_rect = extras.get("band_rect")
-        slot_rect = extras.get("slot_rect")
-        due_rect = extras.get("due_rect")
-        token_boxes = extras.get("token_boxes") if isinstance(extras.get("token_boxes"), dict) else {}
-
-        self._draw_rect(painter, band_rect, scale_x, scale_y, QColor(37, 99, 235), 2, 30)
-        self._draw_rect(painter, slot_rect, scale_x, scale_y, QColor(16, 185, 129), 3, 50)
-        self._draw_rect(painter, due_rect, scale_x, scale_y, QColor(249, 115, 22), 3, 0)
-
-        for rect in token_boxes.get("bp", []) if isinstance(token_boxes, dict) else []:
-            self._draw_rect(painter, rect, scale_x, scale_y, QColor(139, 92, 246), 2, 60)
-        for rect in token_boxes.get("hr", []) if isinstance(token_boxes, dict) else []:
-            self._draw_rect(painter, rect, scale_x, scale_y, QColor(14, 165, 233), 2, 60)
+        bounds = QRectF(pixmap.rect())
+        for (pen, brush), rects in groups:
+            self._draw_rects(painter, bounds, rects, scale_x, scale_y, pen, brush)
 
         painter.end()
         return pixmap
 
+    def _render_page_image(self, page_key: PageKey, generation: int) -> Optional[QImage]:
+        pdf_path, mtime, page_index, render_scale = page_key
+        with self._doc_lock:
+            # Checked under the lock so a job queued before clear() cannot
+            # reopen the document after it was closed.
+            if generation == _PREFETCH_GENERATION:
+                if self._page_cache_key(page_key) not in self._prefetch_pending:
+                    return None
+            elif generation != self._preview_generation:
+                return None
+            try:
+                doc = self._open_document(pdf_path, mtime)
+                if page_index < 0 or page_index >= len(doc):
+                    return None
+                page = doc.load_page(page_index)
+                pix = page.get_pixmap(
+                    matrix=fitz.Matrix(render_scale, render_scale),
+                    colorspace=fitz.csRGB,
+                    alpha=False,
+                )
+            except Exception:  # pragma: no cover - defensive
+                return None
+        # Forced RGB output maps straight onto RGB888, so MuPDF's buffer is wrapped
+        # without a PNG round-trip; copy() then detaches the image from it.
+        samples = pix.samples_mv if hasattr(pix, "samples_mv") else pix.samples
+        image = QImage(samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888).copy()
+        return None if image.isNull() else image
+
+    def _open_document(self, pdf_path: str, mtime: float) -> "fitz.Document":
+        cached = self._fitz_doc
+        if cached is not None and cached[0] == pdf_path and cached[1] == mtime:
+            return cached[2]
+        self._release_document()
+        doc = fitz.open(pdf_path)  # type: ignore[attr-defined]
+        self._fitz_doc = (pdf_path, mtime, doc)
+        return doc
+
+    def _close_document(self) -> None:
+        with self._doc_lock:
+            self._release_document()
+
+    def _release_document(self) -> None:
+        cached = self._fitz_doc
+        self._fitz_doc = None
+        if cached is not None:
+            try:
+                cached[2].close()
+                # Drop the fonts/images MuPDF kept for the closed document.
+                fitz.TOOLS.store_shrink(100)  # type: ignore[attr-defined]
+            except Exception:  # pragma: no cover - defensive
+                pass
+
     @staticmethod
-    def _draw_rect(
+    def _collect_overlay_groups(extras: dict) -> List[OverlayGroup]:
+        token_boxes = EvidencePanel._as_dict(extras.get("token_boxes"))
+        candidates = (
+            (_BAND_STYLE, [extras.get("band_rect")]),
+            (_SLOT_STYLE, [extras.get("slot_rect")]),
+            (_DUE_STYLE, [extras.get("due_rect")]),
+            (_BP_STYLE, token_boxes.get("bp") or []),
+            (_HR_STYLE, token_boxes.get("hr") or []),
+        )
+        groups: List[OverlayGroup] = []
+        for style, rects in candidates:
+            valid = [
+                (x0, y0, x1 - x0, y1 - y0)
+                for x0, y0, x1, y1 in (rect for rect in rects if rect is not None)
+                if x1 > x0 and y1 > y0
+            ]
+            if valid:
+                groups.append((style, valid))
+        return groups
+
+    @staticmethod
+    def _draw_rects(
         painter: QPainter,
-        rect: Optional[Tuple[float, float, float, float]],
+        bounds: QRectF,
+        rects: List[Tuple[float, float, float, float]],
         scale_x: float,
         scale_y: float,
-        color: QColor,
-        pen_width: int,
-        fill_alpha: int,
+        pen: QPen,
+        brush: QBrush,
     ) -> None:
-        if rect is None:
-            return
-        x0, y0, x1, y1 = rect
-        width = max(0.0, x1 - x0)
-        height = max(0.0, y1 - y0)
-        if width <= 0.0 or height <= 0.0:
+        q_rects = [
+            QRectF(x * scale_x, y * scale_y, width * scale_x, height * scale_y)
+            for x, y, width, height in rects
+        ]
+        # Boxes that miss the page raster entirely would only cost painter work.
+        q_rects = [q_rect for q_rect in q_rects if q_rect.intersects(bounds)]
+        if not q_rects:
             return
-        q_rect = QRectF(x0 * scale_x, y0 * scale_y, width * scale_x, height * scale_y)
-        fill_color = QColor(color)
-        fill_color.setAlpha(max(0, min(255, fill_alpha)))
-        painter.fillRect(q_rect, fill_color)
-        pen = QPen(color)
-        pen.setWidth(max(1, pen_width))
+        # drawRects fills with the brush, then strokes with the pen.
         painter.setPen(pen)
-        painter.drawRect(q_rect)
+        painter.setBrush(brush)
+        painter.drawRects(q_rects)
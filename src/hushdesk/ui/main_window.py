@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from PySide6.QtCore import QThread, QSize, Qt, Signal, Slot, QUrl
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, QSize, Qt, QTimer, Signal, Slot, QUrl
 from PySide6.QtGui import (
     QAction,
     QDesktopServices,
@@ -54,6 +54,112 @@ from .preview_dialog import PreviewDialog
 from .review_explorer import ReviewExplorer
 from .ui_prefs import UIPrefs
 
+# Static widget styles, parsed once for the whole window instead of per widget.
+# Palette-dependent header labels keep their own sheets (_apply_header_styles).
+_APP_QSS = """
+QFrame#Chip {
+    border-radius: 12px;
+    background-color: #f2f2f7;
+    padding: 6px 12px;
+}
+QFrame#Chip QLabel {
+    color: #1c1c1e;
+}
+QLabel#ChipTitle {
+    font-size: 12px;
+    font-weight: 500;
+    text-transform: uppercase;
+}
+QLabel#ChipValue {
+    font-size: 18px;
+    font-weight: 600;
+}
+QFrame#DropArea {
+    border: 2px dashed #8e8e93;
+    border-radius: 12px;
+    background-color: #ffffff;
+}
+QLabel#DropAreaSubtitle {
+    color: #8e8e93;
+    font-size: 12px;
+}
+QPushButton#RunButton {
+    background-color: #2563EB;
+    color: #F9FAFB;
+    border-radius: 6px;
+    padding: 8px 16px;
+    font-size: 14px;
+    font-weight: 600;
+}
+QPushButton#RunButton:disabled {
+    background-color: #1f2937;
+    color: #9CA3AF;
+}
+QLabel#ExportTargetLabel, QLabel#BandCoverageLabel {
+    color: #6B7280;
+    font-size: 12px;
+}
+QLabel#StatusBanner {
+    background-color: #fff4c2;
+    border: 1px solid #ffd166;
+    border-radius: 8px;
+    padding: 8px 12px;
+    color: #5c4400;
+    font-weight: 500;
+}
+QLabel#StatusBanner a {
+    color: #1d4ed8;
+    text-decoration: underline;
+}
+QLabel#DecisionsInfoLabel {
+    color: #4B5563;
+    font-size: 12px;
+    font-weight: 500;
+    padding: 2px 4px;
+}
+"""
+
+# Parsed settings.json per path as (st_mtime_ns, settings, serialized payload).
+_SETTINGS_CACHE: dict[Path, tuple[int, dict, str]] = {}
+
+
+def _write_settings(path: Path, payload: str, settings: dict) -> None:
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[2] == payload:
+        # Unchanged since our last read/write; only rewrite if the file moved on.
+        try:
+            if path.stat().st_mtime_ns == cached[0]:
+                return
+        except OSError:
+            pass
+    path.write_text(payload)
+    _SETTINGS_CACHE[path] = (path.stat().st_mtime_ns, settings, payload)
+
+
+class _SettingsWriterSignals(QObject):
+    failed = Signal(str)
+
+
+class _SettingsWriter(QRunnable):
+    """Persist one settings snapshot off the GUI thread."""
+
+    def __init__(self, path: Path, payload: str, settings: dict, signals: _SettingsWriterSignals) -> None:
+        super().__init__()
+        self._path = path
+        self._payload = payload
+        self._settings = settings
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            _write_settings(self._path, self._payload, self._settings)
+        except OSError as exc:
+            try:
+                self._signals.failed.emit(str(exc))
+            except RuntimeError:
+                # The window was destroyed before the write finished.
+                pass
+
 
 class _Chip(QFrame):
     """Simple chip-style widget displaying a label and a value."""
@@ -63,27 +169,15 @@ class _Chip(QFrame):
         self.setObjectName("Chip")
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setFrameShadow(QFrame.Shadow.Raised)
-        self.setStyleSheet(
-            """
-            QFrame#Chip {
-                border-radius: 12px;
-                background-color: #f2f2f7;
-                padding: 6px 12px;
-            }
-            QFrame#Chip QLabel {
-                color: #1c1c1e;
-            }
-            """
-        )
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 6, 8, 6)
         layout.setSpacing(2)
 
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("font-size: 12px; font-weight: 500; text-transform: uppercase;")
+        self.title_label.setObjectName("ChipTitle")
         self.value_label = QLabel("0")
-        self.value_label.setStyleSheet("font-size: 18px; font-weight: 600;")
+        self.value_label.setObjectName("ChipValue")
 
         layout.addWidget(self.title_label, alignment=Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(self.value_label, alignment=Qt.AlignmentFlag.AlignLeft)
@@ -101,22 +195,13 @@ class _DropArea(QFrame):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.setObjectName("DropArea")
-        self.setStyleSheet(
-            """
-            QFrame#DropArea {
-                border: 2px dashed #8e8e93;
-                border-radius: 12px;
-                background-color: #ffffff;
-            }
-            """
-        )
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(6)
 
         self.title = QLabel("Drag MAR PDF here")
         self.subtitle = QLabel("or use the Browse button")
-        self.subtitle.setStyleSheet("color: #8e8e93; font-size: 12px;")
+        self.subtitle.setObjectName("DropAreaSubtitle")
         self.title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -160,6 +245,7 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.setWindowTitle("HushDesk — BP Audit")
         self.resize(960, 640)
+        self.setStyleSheet(_APP_QSS)
 
         self._app_support_dir = app_support_dir
         self._settings_path = self._app_support_dir / self.SETTINGS_FILENAME
@@ -169,6 +255,7 @@ class MainWindow(QMainWindow):
         self._worker: Optional[AuditWorker] = None
         self._audit_completed = False
         self._total_bands = 0
+        self._last_progress: Optional[tuple[int, int]] = None
         self._no_data_for_date = False
         self._active_toasts: list[QMessageBox] = []
         self._header_text_color = "#E5E7EB"
@@ -203,6 +290,16 @@ class MainWindow(QMainWindow):
         palette_changed = getattr(QGuiApplication, "paletteChanged", None)
         if callable(getattr(palette_changed, "connect", None)):
             palette_changed.connect(self._refresh_header_colors)
+        # Coalesce bursts of settings changes into one write per quiet period.
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(250)
+        self._settings_flush_timer.timeout.connect(self._flush_settings_to_disk)
+        # One writer thread keeps snapshots landing on disk in request order.
+        self._settings_pool = QThreadPool(self)
+        self._settings_pool.setMaxThreadCount(1)
+        self._settings_signals = _SettingsWriterSignals(self)
+        self._settings_signals.failed.connect(self._on_settings_write_failed)
         self._load_settings()
         self._build_ui()
         self._create_actions()
@@ -244,22 +341,7 @@ class MainWindow(QMainWindow):
         self.run_button = QPushButton("Run Audit")
         self.run_button.setEnabled(False)
         self.run_button.clicked.connect(self._start_audit)
-        self.run_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #2563EB;
-                color: #F9FAFB;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: 600;
-            }
-            QPushButton:disabled {
-                background-color: #1f2937;
-                color: #9CA3AF;
-            }
-            """
-        )
+        self.run_button.setObjectName("RunButton")
 
         header_layout.addWidget(self.source_label, 0, 0, 1, 2)
         header_layout.addWidget(self.run_button, 0, 2, 1, 1)
@@ -273,7 +355,6 @@ class MainWindow(QMainWindow):
 
         self.export_target_label = QLabel()
         self.export_target_label.setObjectName("ExportTargetLabel")
-        self.export_target_label.setStyleSheet("color: #6B7280; font-size: 12px;")
         self.export_target_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         export_controls.addWidget(self.export_target_label)
         export_controls.addStretch(1)
@@ -287,22 +368,6 @@ class MainWindow(QMainWindow):
         self.status_banner.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_banner.setTextFormat(Qt.TextFormat.RichText)
         self.status_banner.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
-        self.status_banner.setStyleSheet(
-            """
-            QLabel#StatusBanner {
-                background-color: #fff4c2;
-                border: 1px solid #ffd166;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #5c4400;
-                font-weight: 500;
-            }
-            QLabel#StatusBanner a {
-                color: #1d4ed8;
-                text-decoration: underline;
-            }
-            """
-        )
         self.status_banner.linkActivated.connect(self._on_status_link_activated)
         self.status_banner.hide()
 
@@ -335,7 +400,6 @@ class MainWindow(QMainWindow):
         chips_layout.addStretch(1)
         self._band_coverage_label = QLabel("Bands: —")
         self._band_coverage_label.setObjectName("BandCoverageLabel")
-        self._band_coverage_label.setStyleSheet("color: #6B7280; font-size: 12px;")
         chips_layout.addWidget(self._band_coverage_label)
 
         self.review_explorer = ReviewExplorer()
@@ -345,9 +409,6 @@ class MainWindow(QMainWindow):
 
         self._decisions_info_label = QLabel("No parameter-bound meds in this block.")
         self._decisions_info_label.setObjectName("DecisionsInfoLabel")
-        self._decisions_info_label.setStyleSheet(
-            "color: #4B5563; font-size: 12px; font-weight: 500; padding: 2px 4px;"
-        )
         self._decisions_info_label.hide()
 
         review_container = QWidget()
@@ -376,6 +437,14 @@ class MainWindow(QMainWindow):
         self.log_panel.setObjectName("LogPanel")
         self.log_panel.setReadOnly(True)
         self.log_panel.setPlaceholderText("Audit log will appear here.")
+        self.log_panel.setMaximumBlockCount(2000)
+        self.log_panel.setUndoRedoEnabled(False)
+        # Worker log bursts are appended in one batch per timer tick.
+        self._log_buffer: list[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
 
         content_splitter = QSplitter(Qt.Orientation.Vertical)
         content_splitter.addWidget(top_splitter)
@@ -909,19 +978,36 @@ class MainWindow(QMainWindow):
 
     def _load_settings(self) -> None:
         self._settings_store: dict[str, str] = {}
-        if not self._settings_path.exists():
+        try:
+            mtime_ns = self._settings_path.stat().st_mtime_ns
+        except OSError:
+            return
+        cached = _SETTINGS_CACHE.get(self._settings_path)
+        if cached is not None and cached[0] == mtime_ns:
+            self._settings_store = dict(cached[1])
             return
         try:
             self._settings_store = json.loads(self._settings_path.read_text())
         except json.JSONDecodeError:
             # Corrupted settings should be ignored but not fatal
             self._settings_store = {}
+            return
+        if isinstance(self._settings_store, dict):
+            payload = json.dumps(self._settings_store, indent=2)
+            _SETTINGS_CACHE[self._settings_path] = (mtime_ns, dict(self._settings_store), payload)
 
     def _save_settings(self) -> None:
-        try:
-            self._settings_path.write_text(json.dumps(self._settings_store, indent=2))
-        except OSError as exc:
-            QMessageBox.warning(self, "Settings Error", f"Unable to persist settings: {exc}")
+        self._settings_flush_timer.start()
+
+    def _flush_settings_to_disk(self) -> None:
+        self._settings_flush_timer.stop()
+        payload = json.dumps(self._settings_store, indent=2)
+        writer = _SettingsWriter(self._settings_path, payload, dict(self._settings_store), self._settings_signals)
+        self._settings_pool.start(writer)
+
+    @Slot(str)
+    def _on_settings_write_failed(self, message: str) -> None:
+        QMessageBox.warning(self, "Settings Error", f"Unable to persist settings: {message}")
 
     # --- Actions --------------------------------------------------------------------
 
@@ -948,7 +1034,7 @@ class MainWindow(QMainWindow):
         self._audit_completed = False
         self.copy_action.setEnabled(False)
         self.save_action.setEnabled(False)
-        self.log_panel.setPlainText("Ready to audit placeholder MAR.")
+        self._reset_log("Ready to audit placeholder MAR.")
         self._reset_progress()
         self._settings_store["last_open_dir"] = str(absolute_path.parent)
         self._save_settings()
@@ -1012,6 +1098,7 @@ class MainWindow(QMainWindow):
         return pages_with_band, pages_total
 
     def _reset_progress(self) -> None:
+        self._last_progress = None
         self._set_band_progress_label(None, None)
         self._set_band_coverage_label(None, None)
         self.progress_bar.setRange(0, 1)
@@ -1075,7 +1162,7 @@ class MainWindow(QMainWindow):
         self.save_action.setEnabled(False)
 
         self._reset_progress()
-        self.log_panel.setPlainText("Running MAR audit…")
+        self._reset_log("Running MAR audit…")
         self._append_log_line(f"Started audit: {pdf_path}")
         self._write_gui_log_entry(f"Started audit: {pdf_path}")
 
@@ -1272,16 +1359,25 @@ class MainWindow(QMainWindow):
 
     @Slot(str)
     def _on_run_started(self, input_path: str) -> None:
-        self.log_panel.clear()
+        self._reset_log()
         self._reset_progress()
         self._last_saved_log = None
         self._append_log_line(f"Started audit: {input_path}")
 
     @Slot(int, int)
     def _on_progress_changed(self, current: int, total: int) -> None:
+        if (current, total) == self._last_progress:
+            return
+        self._last_progress = (current, total)
         self._set_band_progress_label(current, total)
-        self.progress_bar.setRange(0, total)
-        self.progress_bar.setValue(current)
+        bar = self.progress_bar
+        if bar.minimum() != 0 or bar.maximum() != total:
+            bar.setRange(0, total)
+            bar.setValue(current)
+            return
+        # Only touch the bar when the whole percent it renders would change.
+        if total <= 0 or (current * 100) // total != (bar.value() * 100) // total:
+            bar.setValue(current)
 
     @Slot(dict)
     def _on_summary_counts(self, counts: dict) -> None:
@@ -1594,10 +1690,27 @@ class MainWindow(QMainWindow):
     def _append_log_line(self, message: str) -> None:
         if not message:
             return
-        self.log_panel.appendPlainText(message)
-        cursor = self.log_panel.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.log_panel.setTextCursor(cursor)
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_buffer(self) -> None:
+        if not self._log_buffer:
+            return
+        scrollbar = self.log_panel.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.log_panel.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+        if at_bottom:
+            cursor = self.log_panel.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            self.log_panel.setTextCursor(cursor)
+
+    def _reset_log(self, text: str = "") -> None:
+        # Lines still buffered belong to the log being replaced.
+        self._log_buffer.clear()
+        self._log_flush_timer.stop()
+        self.log_panel.setPlainText(text)
 
     def _dismiss_toasts_with_title(self, title: str) -> None:
         for toast in list(self._active_toasts):
@@ -1617,6 +1730,9 @@ class MainWindow(QMainWindow):
         toast.open()
 
     def closeEvent(self, event) -> None:  # noqa: N802
+        if self._settings_flush_timer.isActive():
+            self._flush_settings_to_disk()
+        self._settings_pool.waitForDone()
         thread = self._thread
         if thread is not None:
             try:
@@ -213,8 +213,14 @@ class ReviewExplorer(QWidget):
         exceptions_only = self._exceptions_only
         filter_ids = self._anomaly_filter_ids
 
+        grouped: Dict[str, List[dict]] = {kind: [] for kind in _KIND_ORDER}
+        for record in self._records:
+            bucket = grouped.get(record.get("kind"))
+            if bucket is not None:
+                bucket.append(record)
+
         for kind in _KIND_ORDER:
-            kind_records = [record for record in self._records if record.get("kind") == kind]
+            kind_records = grouped[kind]
             count_key = _COUNT_KEY_MAP.get(kind)
             if not kind_records and (count_key is None or count_key not in self._counts):
                 continue
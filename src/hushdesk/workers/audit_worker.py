@@ -29,7 +29,7 @@ from hushdesk.pdf.columns import ColumnBand, select_audit_columns
 from hushdesk.pdf.dates import format_mmddyyyy, resolve_audit_date
 from hushdesk.pdf.mar_header import audit_date_from_filename
 from hushdesk.pdf.mar_parser_mupdf import run_mar_audit
-from hushdesk.pdf.duecell import DueMark, detect_due_mark
+from hushdesk.pdf.duecell import CODE_TOKEN_RE, DueMark, detect_due_mark
 from hushdesk.pdf.geometry import normalize_rect
 from hushdesk.pdf.rows import find_row_bands_for_block
 from hushdesk.pdf.vitals import attach_clusters_to_slots, extract_vitals_in_band
@@ -50,10 +50,12 @@ else:
 
 logger = logging.getLogger(__name__)
 
-DEBUG_DECISION_DETAILS = False
+# Per-block DEBUG log lines are opt-in so normal audits skip formatting them.
+DEBUG_DECISION_DETAILS = os.getenv("HUSHDESK_DEBUG", "").lower() in {"1", "true", "yes", "on"}
 
 TIME_RE = re.compile(r"\b(?:[0-1]?\d|2[0-3]):[0-5]\d\b")
 CHECKMARK_RE = re.compile(r"[\u221A\u2713\u2714]")
+ALLOWED_CODE_TOKENS = frozenset({"4", "6", "11", "12", "15"})
 ROW_PADDING = 4.0
 
 
@@ -171,9 +173,10 @@ class AuditWorker(QObject):
         }
         self.summary_payload.emit(payload)
 
+        # The audit has already finished here, so intermediate ticks would only
+        # queue N signals that collapse into the final value on the receiver.
         total_blocks = max(result.blocks, 1)
-        for index in range(1, total_blocks + 1):
-            self.progress.emit(index, total_blocks)
+        self.progress.emit(total_blocks, total_blocks)
 
         export_dir = self._export_dir or exports_dir()
         export_dir.mkdir(parents=True, exist_ok=True)
@@ -1551,13 +1554,10 @@ class AuditWorker(QObject):
 
     @staticmethod
     def _parse_allowed_code(mark_text: str) -> Optional[int]:
-        allowed = {"4", "6", "11", "12", "15"}
-        for match in re.findall(r"\b(\d{1,2})\b", mark_text):
-            if match in allowed:
-                try:
-                    return int(match)
-                except ValueError:
-                    continue
+        for match in CODE_TOKEN_RE.finditer(mark_text):
+            token = match.group(1)
+            if token in ALLOWED_CODE_TOKENS:
+                return int(token)
         return None
 
     @staticmethod
@@ -95,6 +95,56 @@ class TxtWriterTests(unittest.TestCase):
         self.assertTrue(any(line.startswith("Notes — Room not resolved") for line in content))
         self.assertTrue(content[-1].startswith("Generated: "))
 
+    def test_write_report_orders_reviewed_records(self) -> None:
+        records = [
+            DecisionRecord(
+                hall="Bridgeman",
+                date_mmddyyyy="11/03/2025",
+                source_basename="sample.pdf",
+                room_bed=room_bed,
+                dose=dose,
+                kind=kind,
+                rule_text="Hold if SBP < 100",
+                vital_text="BP 120/70",
+                code=None,
+                dcd_reason=None,
+            )
+            for room_bed, dose, kind in (
+                ("Unknown", "AM", "COMPLIANT"),
+                ("312-2", "PM", "HOLD-MISS"),
+                ("301-1", "PM", "COMPLIANT"),
+                ("301-1", "AM", "HELD-OK"),
+            )
+        ]
+        counts = {"reviewed": 4}
+
+        with TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "report.txt"
+            write_report(records, counts, "11/03/2025", "Bridgeman", "sample.pdf", out_path)
+            lines = out_path.read_text(encoding="utf-8").splitlines()
+
+        reviewed = lines[lines.index("All Reviewed —") + 1 :]
+        self.assertTrue(reviewed[0].startswith("HOLD-MISS — 312-2 (PM)"))
+        self.assertTrue(reviewed[1].startswith("HELD-OK — 301-1 (AM)"))
+        self.assertTrue(reviewed[2].startswith("COMPLIANT — 301-1 (PM)"))
+        self.assertTrue(reviewed[3].startswith("COMPLIANT — Unknown (AM)"))
+
+    def test_write_report_uses_supplied_generated_stamp(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            out_path = Path(tmpdir) / "report.txt"
+            write_report(
+                [],
+                {},
+                "11/03/2025",
+                "Bridgeman",
+                "sample.pdf",
+                out_path,
+                generated_at="11/03/2025 07:30",
+            )
+            content = out_path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(content[-1], "Generated: 11/03/2025 07:30 (Central)")
+
 
 if __name__ == "__main__":
     unittest.main()
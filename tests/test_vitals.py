@@ -28,6 +28,10 @@ class VitalParsingTests(unittest.TestCase):
     def test_parse_hr_token_plain_number(self) -> None:
         self.assertEqual(parse_hr_token("64"), 64)
 
+    def test_parse_hr_token_ignores_bp_fragment(self) -> None:
+        self.assertIsNone(parse_hr_token("120/80"))
+        self.assertIsNone(parse_hr_token("64", allow_plain=False))
+
     def test_parse_hr_token_invalid(self) -> None:
         self.assertIsNone(parse_hr_token("N/A"))
 